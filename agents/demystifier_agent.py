@@ -5,7 +5,9 @@ from typing import TypedDict, List
 from pydantic import BaseModel, Field
 
 # --- Core LangChain & Document Processing Imports ---
+from pypdf import PdfReader
 from langchain_community.document_loaders import PyPDFLoader
+from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from core_utils.simple_vectorstore import SimpleVectorStore
 from langchain_core.prompts import PromptTemplate
@@ -17,12 +19,29 @@ from langchain_core.output_parsers import StrOutputParser
 # ...
 
 # --- 4. The Master "Controller" Function ---
-def process_document_for_demystification(file_path: str):
-    """Loads a PDF, runs the full analysis, creates a RAG chain, and returns both."""
-    print(f"--- Processing document: {file_path} ---")
+def load_pdf_documents(source, name=None) -> List[Document]:
+    """Loads one Document per PDF page from a file path or a binary file-like object.
+    For file-like objects, `name` is recorded as the pages' source (defaults to "uploaded.pdf")."""
+    if isinstance(source, (str, os.PathLike)):
+        return PyPDFLoader(source).load()
     
-    loader = PyPDFLoader(file_path)
-    documents = loader.load()
+    # In-memory uploads are parsed directly, without a round trip through disk
+    name = name or "uploaded.pdf"
+    reader = PdfReader(source)
+    return [
+        Document(page_content=page.extract_text() or "", metadata={"source": name, "page": i})
+        for i, page in enumerate(reader.pages)
+    ]
+
+def process_document_for_demystification(source, report=None, name=None):
+    """
+    Loads a PDF (path or file-like object), runs the full analysis, creates a RAG chain, and returns both.
+    If a previously generated report is passed in, the analysis graph is skipped and only the RAG chain is built.
+    `name` labels file-like sources, whose own `.name` is not a reliable filename.
+    """
+    print(f"--- Processing document: {name or source} ---")
+    
+    documents = load_pdf_documents(source, name=name)
     
     if not documents:
         raise ValueError("No content found in PDF.")
@@ -38,12 +57,13 @@ def process_document_for_demystification(file_path: str):
     retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
     rag_chain = create_rag_chain(retriever)
     
-    print("--- Running analysis graph for the report ---")
-    chunk_contents = [chunk.page_content for chunk in chunks]
-    # Limit context to avoid token limits if document is huge
-    graph_input = {"document_chunks": chunk_contents[:10]} 
-    
-    result = demystifier_agent_graph.invoke(graph_input)
-    report = result.get("final_report")
+    if report is None:
+        print("--- Running analysis graph for the report ---")
+        chunk_contents = [chunk.page_content for chunk in chunks]
+        # Limit context to avoid token limits if document is huge
+        graph_input = {"document_chunks": chunk_contents[:10]} 
+        
+        result = demystifier_agent_graph.invoke(graph_input)
+        report = result.get("final_report")
     
     return {"report": report, "rag_chain": rag_chain}
\ No newline at end of file
@@ -2,13 +2,13 @@
 
 import os
 from langchain_core.prompts import PromptTemplate
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 from typing import List, TypedDict, Optional
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import PydanticOutputParser
 
 # --- Tool and Core Model Loader Imports ---
-from tools.legal_tools import legal_search
+from tools.legal_tools import legal_search_async
 from core_utils.core_model_loaders import load_gemini_llm
 
 # --- Pydantic Models ---
@@ -23,6 +23,9 @@ class LegalTriviaOutput(BaseModel):
 # --- Setup Models and Parsers ---
 parser = PydanticOutputParser(pydantic_object=LegalTriviaOutput)
 
+# Bump whenever the prompts below change, so cached results keyed on it are invalidated
+PROMPT_VERSION = "1"
+
 # --- Initialize the LLM ---
 llm = load_gemini_llm()
 
@@ -33,7 +36,7 @@ class LegalAgentState(TypedDict):
     legal_trivia: Optional[LegalTriviaOutput]
 
 # --- LangGraph Nodes ---
-def generate_legal_doc(state: LegalAgentState):
+async def generate_legal_doc(state: LegalAgentState):
     """Generates the legal document based on user request."""
     print("---NODE: Generating Legal Document---")
     prompt_text = (
@@ -44,7 +47,7 @@ def generate_legal_doc(state: LegalAgentState):
         f"User Request: {state['user_request']}"
     )
     try:
-        response = llm.invoke(prompt_text)
+        response = await llm.ainvoke(prompt_text)
         legal_doc_text = response.content if response and response.content else "Error: Failed to generate contract."
     except Exception as e:
         print(f"Contract generation error: {e}")
@@ -52,7 +55,7 @@ def generate_legal_doc(state: LegalAgentState):
         
     return {"legal_doc": legal_doc_text}
 
-def get_legal_trivia(state: LegalAgentState):
+async def get_legal_trivia(state: LegalAgentState):
     """Fetches relevant legal trivia to educate the user."""
     print("---NODE: Fetching Legal Trivia---")
     prompt = PromptTemplate(
@@ -60,10 +63,10 @@ def get_legal_trivia(state: LegalAgentState):
         You are a specialized legal assistant for India's workforce.
         Based on the user's situation, provide 3 important legal rights or points they should be aware of.
         
+        {format_instructions}
+        
         User's situation: {user_request}
         Web search results: {search_results}
-        
-        {format_instructions}
         """,
         input_variables=["user_request", "search_results"],
         partial_variables={"format_instructions": parser.get_format_instructions()},
@@ -71,13 +74,13 @@ def get_legal_trivia(state: LegalAgentState):
     chain = prompt | llm | parser
     
     try:
-        search_results = legal_search.invoke(state["user_request"])
+        search_results = await legal_search_async.ainvoke(state["user_request"])
     except Exception as e:
         print(f"Legal search failed: {e}")
         search_results = "Search unavailable."
 
     try:
-        structured_trivia = chain.invoke({"user_request": state["user_request"], "search_results": search_results})
+        structured_trivia = await chain.ainvoke({"user_request": state["user_request"], "search_results": search_results})
     except Exception as e:
         print(f"Trivia generation failed: {e}")
         structured_trivia = LegalTriviaOutput(trivia=[])
@@ -85,10 +88,13 @@ def get_legal_trivia(state: LegalAgentState):
     return {"legal_trivia": structured_trivia}
 
 # --- Build Graph ---
+# Both nodes only depend on the user request, so they run in parallel; the nodes
+# are coroutines, so the graph must be run with ainvoke()
 workflow = StateGraph(LegalAgentState)
 workflow.add_node("generate_legal_doc", generate_legal_doc)
 workflow.add_node("get_legal_trivia", get_legal_trivia)
-workflow.set_entry_point("generate_legal_doc")
-workflow.add_edge("generate_legal_doc", "get_legal_trivia")
+workflow.add_edge(START, "generate_legal_doc")
+workflow.add_edge(START, "get_legal_trivia")
+workflow.add_edge("generate_legal_doc", END)
 workflow.add_edge("get_legal_trivia", END)
 legal_agent = workflow.compile()
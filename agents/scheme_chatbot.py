@@ -2,13 +2,13 @@
 
 import os
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import PydanticOutputParser
 from typing import List
 
 # --- Tool and Core Model Loader Imports ---
-from tools.scheme_tools import scheme_search
+from tools.scheme_tools import scheme_search, scheme_search_async
 from core_utils.core_model_loaders import load_gemini_llm
 
 # --- Pydantic Models ---
@@ -34,10 +34,10 @@ prompt = PromptTemplate(
     Find the most relevant official government schemes for the profile below.
     Focus on accuracy and official sources.
     
+    {format_instructions}
+    
     User Profile: {user_profile}
     Web search results: {search_results}
-    
-    {format_instructions}
     """,
     input_variables=["user_profile", "search_results"],
     partial_variables={"format_instructions": parser.get_format_instructions()},
@@ -52,9 +52,22 @@ def get_search_results(query: dict):
         print(f"Scheme search failed: {e}")
         return "Search unavailable."
 
+async def aget_search_results(query: dict):
+    print(f"---NODE: Searching Schemes for profile: {query['user_profile']}---")
+    try:
+        return await scheme_search_async.ainvoke(query["user_profile"])
+    except Exception as e:
+        print(f"Scheme search failed: {e}")
+        return "Search unavailable."
+
+def has_search_results(search_results) -> bool:
+    """True when the search step returned real results, not an error string or nothing."""
+    return isinstance(search_results, list) and len(search_results) > 0
+
+# ainvoke() awaits the search instead of running the blocking version in a thread.
+# The output keeps the search results next to the parsed schemes, so callers can
+# tell an answer grounded in search from one the LLM made up without it.
 scheme_chatbot = (
-    {"search_results": get_search_results, "user_profile": RunnablePassthrough()}
-    | prompt
-    | llm
-    | parser
+    {"search_results": RunnableLambda(get_search_results, afunc=aget_search_results), "user_profile": RunnablePassthrough()}
+    | RunnablePassthrough.assign(schemes=prompt | llm | parser)
 )
\ No newline at end of file
@@ -0,0 +1,184 @@
+# D:\jan-contract\components\contract_generator.py
+
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+import requests
+from utils.api_client import get_http, endpoints, post_json, read_json, DEFAULT_TIMEOUT
+from components.video_recorder import record_consent_video
+
+# Videos larger than one chunk are uploaded in parallel chunks, so a dropped
+# mobile connection only costs the chunk in flight rather than the whole file
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+UPLOAD_WORKERS = 3
+UPLOAD_CHUNK_RETRIES = 3
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner="Preparing PDF...")
+def _contract_pdf(backend_url: str, contract_id: str) -> bytes:
+    """Fetches a contract's PDF once; reruns reuse the cached bytes."""
+    response = get_http().get(f"{endpoints(backend_url).contracts}/{contract_id}/pdf", timeout=DEFAULT_TIMEOUT)
+    # Raising keeps failed renders out of the cache
+    response.raise_for_status()
+    return response.content
+
+def _upload_chunk(http, url: str, video_path: str, upload_id: str, index: int, total: int, form: dict) -> dict:
+    """Sends one chunk of the video, retrying just this chunk on failure."""
+    with open(video_path, 'rb') as f:
+        f.seek(index * UPLOAD_CHUNK_SIZE)
+        chunk = f.read(UPLOAD_CHUNK_SIZE)
+    headers = {"X-Upload-Id": upload_id, "X-Chunk-Index": str(index), "X-Total-Chunks": str(total)}
+    files = {'file': (os.path.basename(video_path), chunk, 'video/mp4')}
+    for attempt in range(UPLOAD_CHUNK_RETRIES):
+        if attempt:
+            # Back off before retrying so a struggling link or server gets a moment to recover
+            time.sleep(0.5 * 2 ** (attempt - 1))
+        try:
+            resp = http.post(url, files=files, data=form, headers=headers, timeout=DEFAULT_TIMEOUT)
+            if resp.status_code == 200:
+                return read_json(resp)["data"]
+            if resp.status_code < 500:
+                # Validation errors won't go away on retry
+                raise RuntimeError(resp.text)
+        except (OSError, ValueError):
+            if attempt == UPLOAD_CHUNK_RETRIES - 1:
+                raise
+    raise RuntimeError(f"Chunk {index + 1} of {total} failed after {UPLOAD_CHUNK_RETRIES} attempts")
+
+def upload_consent_video(backend_url: str, video_path: str, contract_id: str, consent_text: str) -> dict:
+    """
+    Uploads a consent video, chunked when it is larger than one chunk.
+    The upload id is kept in the session, so pressing Upload again after a
+    failure resumes from the chunks the server already has.
+    """
+    form = {'contract_id': contract_id, 'consent_text': consent_text}
+    size = os.path.getsize(video_path)
+    if size <= UPLOAD_CHUNK_SIZE:
+        with open(video_path, 'rb') as f:
+            files = {'file': (os.path.basename(video_path), f, 'video/mp4')}
+            resp = get_http().post(endpoints(backend_url).upload_video, files=files, data=form, timeout=DEFAULT_TIMEOUT)
+        if resp.status_code != 200:
+            raise RuntimeError(resp.text)
+        return read_json(resp)["data"]
+
+    uploads = st.session_state.setdefault("consent_upload_ids", {})
+    upload_id = uploads.setdefault((video_path, contract_id), str(uuid.uuid4()))
+    url = endpoints(backend_url).upload_video_chunk
+    # Resolved here: worker threads have no Streamlit script context
+    http = get_http()
+    total = -(-size // UPLOAD_CHUNK_SIZE)
+
+    status = http.get(f"{url}/{upload_id}", timeout=DEFAULT_TIMEOUT)
+    received = set(read_json(status)["data"]["received"]) if status.status_code == 200 else set()
+    pending = [i for i in range(total) if i not in received]
+
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        results = list(pool.map(lambda i: _upload_chunk(http, url, video_path, upload_id, i, total, form), pending))
+
+    done = next((r for r in results if r.get("complete")), None)
+    if done is None:
+        # Every chunk was accepted but nothing got assembled (e.g. the server went down
+        # in between); resuming this id would hit the same wall, so the next try starts fresh
+        uploads.pop((video_path, contract_id), None)
+        raise RuntimeError("Server did not confirm the assembled video")
+    del uploads[(video_path, contract_id)]
+    return done
+
+@st.fragment
+def render_contract_generator(backend_url: str):
+    """Renders the Contract Generator tool: drafting, PDF download and video consent."""
+    st.header("Digital Agreement Generator")
+    st.write("Create a clear digital agreement from plain text and record video consent.")
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.subheader("Agreement Details")
+        user_request = st.text_area("Describe the terms of the agreement...", height=150, key="contract_request", placeholder="E.g., I, Rajesh, agree to paint Mr. Sharma's house for 5000 rupees by next Tuesday.")
+        
+        if st.button("Generate Agreement", type="primary", key="btn_generate_contract"):
+            if user_request:
+                with st.status("Drafting agreement...") as status:
+                    try:
+                        # Drafts are cached per session rather than with st.cache_data: each one
+                        # owns a contract_id that consent videos attach to, so it must not be
+                        # handed to another user who happens to type the same request. The
+                        # backend URL is part of the key because contract ids only live there.
+                        drafts = st.session_state.setdefault("contract_drafts", {})
+                        draft_key = (backend_url, user_request)
+                        data = drafts.get(draft_key)
+                        if data is None:
+                            st.write("Writing the contract and researching relevant laws...")
+                            try:
+                                data = post_json(endpoints(backend_url).generate_contract, {"user_request": user_request})
+                                if data.get("success"):
+                                    drafts[draft_key] = data
+                            except requests.HTTPError as e:
+                                st.error(f"Server Error: {e.response.text}")
+
+                        if data is not None and data.get("success"):
+                            st.session_state.legal_result = data["data"]
+                            if 'video_path_from_component' in st.session_state:
+                                del st.session_state['video_path_from_component']
+                            status.update(label="Agreement drafted", state="complete")
+                        else:
+                            if data is not None:
+                                st.error(f"API Error: {data.get('message')}")
+                            status.update(label="Drafting failed", state="error", expanded=True)
+                    except Exception as e:
+                        st.error(f"Connection failed: {e}")
+                        status.update(label="Drafting failed", state="error", expanded=True)
+            else:
+                st.warning("Please describe the agreement details.")
+    
+    with col2:
+        if 'legal_result' in st.session_state:
+            result = st.session_state.legal_result
+            contract_text = result.get('contract', '')
+            
+            st.subheader("Drafted Agreement")
+            with st.container(border=True):
+                st.markdown(contract_text)
+            
+            # One-click PDF download; the backend starts rendering it as soon as the draft is generated
+            try:
+                pdf_bytes = _contract_pdf(backend_url, result.get('contract_id'))
+                st.download_button(label="Download PDF", data=pdf_bytes, file_name="agreement.pdf", mime="application/pdf")
+            except requests.HTTPError as e:
+                if e.response.status_code == 404:
+                    # The backend no longer has this contract (restart or URL change); forget the
+                    # cached draft so the next Generate drafts a fresh one
+                    drafts = st.session_state.get("contract_drafts", {})
+                    for key in [k for k, d in drafts.items() if d["data"].get("contract_id") == result.get('contract_id')]:
+                        del drafts[key]
+                    st.error("This agreement is no longer on the server. Click Generate Agreement to draft it again.")
+                else:
+                    st.error(f"Failed to generate PDF: {e}")
+            except Exception as e:
+                st.error(f"Failed to generate PDF: {e}")
+
+            if result.get('legal_trivia') and result['legal_trivia'].get('trivia'):
+                with st.expander("Legal Insights"):
+                    for item in result['legal_trivia']['trivia']:
+                        st.markdown(f"**{item['point']}**")
+                        st.caption(item['explanation'])
+                        st.markdown(f"[Source]({item['source_url']})")
+
+    st.divider()
+    st.subheader("Video Consent Recording")
+    saved_video_path = record_consent_video()
+    
+    # Upload video to backend if recorded
+    if saved_video_path and 'legal_result' in st.session_state:
+        contract_id = st.session_state.legal_result.get('contract_id')
+        if contract_id:
+             if st.button("Upload Consent to Server"):
+                try:
+                    with st.spinner("Uploading consent video..."):
+                        upload_consent_video(backend_url, saved_video_path, contract_id, "I agree to the terms.")
+                    st.success("Consent uploaded to server securely!")
+                except RuntimeError as e:
+                    st.error(f"Upload failed: {e}")
+                except Exception as e:
+                    st.error(f"Upload error: {e}")
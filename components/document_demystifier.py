@@ -0,0 +1,124 @@
+# D:\jan-contract\components\document_demystifier.py
+
+import orjson
+import streamlit as st
+from utils.api_client import get_http, endpoints, read_json, DEFAULT_TIMEOUT
+
+# Chat turns rendered as individual bubbles; older turns are folded into one expander
+RECENT_CHAT_MESSAGES = 20
+# Messages kept in the session at all; anything older is dropped
+MAX_UI_TURNS = 40
+
+def _sse_tokens(response):
+    """Yields answer tokens from the backend's Server-Sent Events chat stream."""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        event = orjson.loads(line[len("data:"):])
+        if "error" in event:
+            raise RuntimeError(event["error"])
+        if event.get("done"):
+            return
+        yield event.get("token", "")
+
+@st.fragment
+def _render_chat(backend_url: str):
+    """
+    Renders the document chat as its own fragment, so sending a message
+    reruns only the conversation, not the upload form and summary tab.
+    """
+    st.subheader("Ask Questions")
+    
+    # Simple Chat Interface for API
+    if "messages" not in st.session_state:
+        st.session_state.messages = []
+
+    history = st.session_state.messages
+    older, recent = history[:-RECENT_CHAT_MESSAGES], history[-RECENT_CHAT_MESSAGES:]
+    if older:
+        with st.expander(f"Earlier messages ({len(older)})"):
+            st.markdown("\n\n".join(f"**{m['role'].title()}:** {m['content']}" for m in older))
+
+    for message in recent:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+    if prompt := st.chat_input("Ask about the document..."):
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+
+        with st.chat_message("assistant"):
+            # A repeated question about the same document is answered from this session's cache
+            answers = st.session_state.setdefault("demystify_answers", {})
+            answer_key = (st.session_state.session_id, prompt)
+            if answer_key in answers:
+                st.markdown(answers[answer_key])
+                st.session_state.messages.append({"role": "assistant", "content": answers[answer_key]})
+            else:
+                try:
+                    payload = {
+                        "session_id": st.session_state.session_id,
+                        "question": prompt
+                    }
+                    # Render the answer token by token as the backend streams it
+                    with get_http().post(endpoints(backend_url).demystify_chat_stream, json=payload, stream=True, timeout=DEFAULT_TIMEOUT) as chat_resp:
+                        if chat_resp.status_code == 200:
+                            answer = st.write_stream(_sse_tokens(chat_resp))
+                            answers[answer_key] = answer
+                            st.session_state.messages.append({"role": "assistant", "content": answer})
+                        else:
+                            st.error("Failed to get answer.")
+                except Exception as e:
+                    st.error(f"Error: {e}")
+
+        del st.session_state.messages[:-MAX_UI_TURNS]
+
+@st.fragment
+def render_demystifier(backend_url: str):
+    """Renders the Document Demystifier tool: PDF analysis and document chat."""
+    st.header("Document Demystifier")
+    st.write("Upload a legal document to get a simplified summary and ask questions.")
+
+    uploaded_file = st.file_uploader("Upload PDF Document", type="pdf", key="demystify_uploader")
+
+    if uploaded_file and st.button("Analyze Document", type="primary"):
+        with st.status(f"Analyzing {uploaded_file.name}...") as status:
+            try:
+                st.write("Uploading, summarizing and explaining key terms...")
+                # Hand requests the file object itself rather than a getvalue() copy of it
+                uploaded_file.seek(0)
+                files = {"file": (uploaded_file.name, uploaded_file, "application/pdf")}
+                response = get_http().post(endpoints(backend_url).demystify_upload, files=files, timeout=DEFAULT_TIMEOUT)
+                
+                if response.status_code == 200:
+                    st.session_state.demystify_data = read_json(response).get('data', {})
+                    st.session_state.session_id = st.session_state.demystify_data.get('session_id')
+                    status.update(label="Analysis complete!", state="complete")
+                else:
+                    st.error(f"Analysis failed: {response.text}")
+                    status.update(label="Analysis failed", state="error", expanded=True)
+            except Exception as e:
+                st.error(f"Connection error: {e}")
+                status.update(label="Analysis failed", state="error", expanded=True)
+
+    if 'demystify_data' in st.session_state:
+        st.divider()
+        report = st.session_state.demystify_data.get('report', {})
+        
+        tab_summary, tab_chat = st.tabs(["Summary & Analysis", "Chat with Document"])
+        
+        with tab_summary:
+            st.subheader("Document Summary")
+            st.write(report.get('summary', ''))
+            
+            st.subheader("Key Terms Explained")
+            for term in report.get('key_terms', []):
+                with st.expander(f"{term.get('term')}"):
+                    st.write(term.get('explanation'))
+                    st.markdown(f"[Learn More]({term.get('resource_link')})")
+            
+            st.info(f"**Advice:** {report.get('overall_advice')}")
+        
+        with tab_chat:
+            _render_chat(backend_url)
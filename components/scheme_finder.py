@@ -0,0 +1,45 @@
+# D:\jan-contract\components\scheme_finder.py
+
+import streamlit as st
+import requests
+from utils.api_client import endpoints, post_json
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _find_schemes(backend_url: str, user_profile: str) -> dict:
+    """Looks up schemes for a profile; repeat searches are answered from the cache."""
+    # post_json raises on an error status, which keeps failed lookups out of the cache
+    return post_json(endpoints(backend_url).find_schemes, {"user_profile": user_profile}).get('data', {})
+
+@st.fragment
+def render_scheme_finder(backend_url: str):
+    """Renders the Government Scheme Finder tool."""
+    st.header("Government Scheme Finder")
+    st.write("Find relevant government schemes based on your profile.")
+    
+    user_profile = st.text_input("Enter your profile description...", key="scheme_profile", placeholder="E.g., A female farmer in Maharashtra owning 2 acres of land.")
+    
+    if st.button("Search Schemes", type="primary", key="btn_find_schemes"):
+        if user_profile:
+            with st.spinner("Searching schemes via API..."):
+                try:
+                    st.session_state.scheme_response = _find_schemes(backend_url, user_profile)
+                except requests.HTTPError as e:
+                    st.error(f"Error: {e.response.text}")
+                except Exception as e:
+                    st.error(f"Connection error: {e}")
+        else:
+            st.warning("Please enter a profile description.")
+            
+    if 'scheme_response' in st.session_state:
+        response = st.session_state.scheme_response
+        st.subheader(f"Results")
+        schemes = response.get('schemes', [])
+        if schemes:
+            for scheme in schemes:
+                with st.container(border=True):
+                    st.markdown(f"#### {scheme.get('scheme_name')}")
+                    st.write(scheme.get('description'))
+                    st.write(f"**Target Audience:** {scheme.get('target_audience')}")
+                    st.markdown(f"[Official Website]({scheme.get('official_link')})")
+        else:
+            st.info("No specific schemes found.")
@@ -195,16 +195,22 @@ def record_consent_video():
     uploaded_file = st.file_uploader("Drop your recorded video here", type=["webm", "mp4", "mov"])
     if uploaded_file is not None:
         try:
-             # Process the uploaded file
-             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-             ext = os.path.splitext(uploaded_file.name)[1] or ".webm"
-             video_filename = os.path.join(VIDEO_CONSENT_DIR, f"consent_upload_{timestamp}{ext}")
-             
-             with open(video_filename, "wb") as f:
-                 f.write(uploaded_file.getbuffer())
+             # Streamlit reruns this on every interaction; write each upload to disk only once
+             saved = st.session_state.get("consent_video_saved")
+             if saved and saved[0] == uploaded_file.file_id:
+                 video_filename = saved[1]
+             else:
+                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                 ext = os.path.splitext(uploaded_file.name)[1] or ".webm"
+                 video_filename = os.path.join(VIDEO_CONSENT_DIR, f"consent_upload_{timestamp}{ext}")
+                 
+                 with open(video_filename, "wb") as f:
+                     f.write(uploaded_file.getbuffer())
+                 st.session_state.consent_video_saved = (uploaded_file.file_id, video_filename)
              
              st.success("✅ Consent Video Received!")
-             st.video(video_filename)
+             # Preview from the in-memory upload rather than reading the saved file back
+             st.video(uploaded_file, format=uploaded_file.type or "video/webm")
              return video_filename
         except Exception as e:
             st.error(f"Error saving file: {e}")
@@ -1,10 +1,23 @@
 # D:\jan-contract\core_utils\core_model_loaders.py
 
 import os
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
+import threading
+from functools import lru_cache
+from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
+
+# Each loader builds its client once per process; agents that load the same
+# model (e.g. legal_agent and scheme_chatbot) share a single instance.
+
+# lru_cache doesn't stop concurrent first calls from each building a client
+_EMBEDDING_LOCK = threading.Lock()
 
 def load_embedding_model():
     """Loads the embedding model without any Streamlit dependencies or heavy local models."""
+    with _EMBEDDING_LOCK:
+        return _build_embedding_model()
+
+@lru_cache(maxsize=None)
+def _build_embedding_model():
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         print("CRITICAL WARNING: GOOGLE_API_KEY is missing. Embeddings will fail.")
@@ -15,6 +28,7 @@ def load_embedding_model():
 
     return GoogleGenerativeAIEmbeddings(model="models/embedding-001", google_api_key=api_key)
 
+@lru_cache(maxsize=None)
 def load_groq_llm():
     """Loads the Groq LLM without any Streamlit dependencies."""
     api_key = os.getenv("GROQ_API_KEY")
@@ -25,12 +39,14 @@ def load_groq_llm():
             raise ValueError("GROQ_API_KEY is missing. Please check your environment variables.")
         return RunnableLambda(fail_on_invoke)
         
+    from langchain_groq import ChatGroq
     return ChatGroq(
         temperature=0, 
         model="meta-llama/llama-3.3-70b-versatile", # Switched to a standard stable model
         api_key=api_key
     )
 
+@lru_cache(maxsize=None)
 def load_gemini_llm():
     """Loads the Gemini LLM without any Streamlit dependencies."""
     api_key = os.getenv("GOOGLE_API_KEY")
@@ -3,16 +3,25 @@
 
 import os
 import uuid
+import asyncio
+import threading
 import tempfile
 import json
 import datetime
+import hashlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form, BackgroundTasks, Depends
-from fastapi.responses import StreamingResponse, JSONResponse, FileResponse
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Header, BackgroundTasks, Depends
+from fastapi.responses import Response, StreamingResponse, JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, validator
 import io
+import re
 import shutil
 import logging
 from dotenv import load_dotenv
@@ -25,14 +34,41 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import all backend logic and agents
-from agents.legal_agent import legal_agent
-from agents.scheme_chatbot import scheme_chatbot
+from agents.legal_agent import legal_agent, PROMPT_VERSION as LEGAL_PROMPT_VERSION
+from agents.scheme_chatbot import scheme_chatbot, has_search_results
 from agents.demystifier_agent import process_document_for_demystification
 from agents.general_assistant_agent import ask_gemini
 from utils.pdf_generator import generate_formatted_pdf
+from utils.semantic_cache import SemanticCache
+
+# Comma-separated list of origins allowed to call the API from a browser
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
+
+# Interactive docs (/docs, /redoc, /openapi.json) can be switched off in production
+ENABLE_DOCS = os.getenv("ENABLE_DOCS", "true").lower() == "true"
+
+# Storage directories for uploaded media
+VIDEO_CONSENT_DIR = "video_consents"
+PDF_UPLOAD_DIR = "pdfs_demystify"
+# Parts of chunked video uploads are staged here until every chunk has arrived
+VIDEO_CHUNK_DIR = "video_consent_chunks"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create storage directories and warm lazily loaded models once at startup"""
+    for directory in (VIDEO_CONSENT_DIR, PDF_UPLOAD_DIR, VIDEO_CHUNK_DIR):
+        os.makedirs(directory, exist_ok=True)
+    prune_stale_video_chunks()
+    # Load the scheme-cache embedder in the background so the first search doesn't pay for it
+    threading.Thread(target=SCHEME_CACHE.warm, daemon=True).start()
+    yield
 
 # Initialize FastAPI App
 app = FastAPI(
+    lifespan=lifespan,
+    docs_url="/docs" if ENABLE_DOCS else None,
+    redoc_url="/redoc" if ENABLE_DOCS else None,
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,
     title="Jan-Contract Enhanced API",
     description="""
     🏗️ **Enhanced API for India's Informal Workforce**
@@ -58,14 +94,31 @@ app = FastAPI(
 )
 
 # CORS Middleware
+# The API uses no cookies, so credentials stay off and a wildcard origin
+# is sent literally instead of being echoed back per request
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type", "authorization", "x-upload-id", "x-chunk-index", "x-total-chunks"],
 )
 
+# Server-Sent Events endpoints; gzip would hold their tokens back until a block fills
+SSE_PATHS = {"/api/v1/demystify/chat/stream"}
+
+class NonStreamingGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes SSE endpoints through untouched, whatever the client accepts"""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in SSE_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress JSON responses (contract drafts, reports, listings) for clients on
+# slow mobile links; bodies under 1KB aren't worth the CPU
+app.add_middleware(NonStreamingGZipMiddleware, minimum_size=1000)
+
 # Mount Static Files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -151,10 +204,61 @@ class HealthCheck(BaseModel):
 SESSION_CACHE = {}
 CONTRACT_CACHE = {}
 
+# Legal agent results for recent requests (LRU), keyed on prompt version and request hash
+LEGAL_RESULT_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+LEGAL_RESULT_CACHE_SIZE = 64
+
+# Background PDF renders for recent contracts (LRU), keyed by contract ID; an
+# evicted PDF is cheap to re-render since generate_formatted_pdf is cached by text
+PDF_RENDERS: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+PDF_RENDERS_SIZE = 32
+
+# Demystifier analyses keyed by PDF content hash (LRU), so re-uploading the
+# same document reuses its report and RAG chain instead of re-embedding it
+ANALYSIS_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+ANALYSIS_CACHE_SIZE = 32
+
+# Scheme results reused for near-duplicate profiles ("woman farmer in MH" vs
+# "female farmer in Maharashtra"); the similarity threshold and TTL are tunable.
+# Matches are further limited to profiles naming the same states and numbers
+# (see scheme_cache_key), since embeddings barely separate "Bihar" from "Kerala".
+SCHEME_CACHE = SemanticCache(
+    threshold=float(os.getenv("SCHEME_CACHE_THRESHOLD", "0.92")),
+    ttl=float(os.getenv("SCHEME_CACHE_TTL", str(6 * 60 * 60)))
+)
+
+# Indian states and union territories, with the common abbreviations users type
+INDIAN_STATES = {
+    "andhra pradesh": "AP", "arunachal pradesh": "AR", "assam": "AS", "bihar": "BR",
+    "chhattisgarh": "CG", "goa": "GA", "gujarat": "GJ", "haryana": "HR",
+    "himachal pradesh": "HP", "jharkhand": "JH", "karnataka": "KA", "kerala": "KL",
+    "madhya pradesh": "MP", "maharashtra": "MH", "manipur": "MN", "meghalaya": "ML",
+    "mizoram": "MZ", "nagaland": "NL", "odisha": "OD", "punjab": "PB",
+    "rajasthan": "RJ", "sikkim": "SK", "tamil nadu": "TN", "telangana": "TS",
+    "tripura": "TR", "uttar pradesh": "UP", "uttarakhand": "UK", "west bengal": "WB",
+    "andaman and nicobar islands": "AN", "chandigarh": "CH", "dadra and nagar haveli": "DN",
+    "daman and diu": "DD", "delhi": "DL", "jammu and kashmir": "JK", "ladakh": "LA",
+    "lakshadweep": "LD", "puducherry": "PY",
+}
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def scheme_cache_key(user_profile: str) -> tuple:
+    """
+    The entities two profiles must share to reuse each other's schemes:
+    the states they name (full name or upper-case code) and any numbers, like age or income
+    """
+    lowered = user_profile.lower()
+    words = set(re.findall(r"\b[A-Z]{2}\b", user_profile))
+    states = frozenset(
+        code for name, code in INDIAN_STATES.items()
+        if code in words or re.search(rf"\b{name}\b", lowered)
+    )
+    numbers = tuple(sorted(re.findall(r"\d+(?:\.\d+)?", user_profile)))
+    return states, numbers
+
 def get_session_data(session_id: str):
     """Get session data or raise 404 if not found"""
     session_data = SESSION_CACHE.get(session_id)
@@ -169,39 +273,232 @@ def get_contract_data(contract_id: str):
         raise HTTPException(status_code=404, detail="Contract not found")
     return contract_data
 
+async def run_legal_agent(user_request: str) -> Dict[str, Any]:
+    """Invoke the legal agent, reusing the result when the same request was drafted recently"""
+    key = (LEGAL_PROMPT_VERSION, hashlib.sha256(user_request.encode("utf-8")).hexdigest())
+    result = LEGAL_RESULT_CACHE.get(key)
+    if result is not None:
+        LEGAL_RESULT_CACHE.move_to_end(key)
+        return result
+    
+    result = await legal_agent.ainvoke({"user_request": user_request})
+    # The agent reports failures as "Error: ..." text, and a failed search or
+    # trivia call as an empty trivia list; don't pin either in the cache
+    trivia = result.get('legal_trivia')
+    if not result.get('legal_doc', '').startswith("Error") and trivia is not None and trivia.trivia:
+        LEGAL_RESULT_CACHE[key] = result
+        if len(LEGAL_RESULT_CACHE) > LEGAL_RESULT_CACHE_SIZE:
+            LEGAL_RESULT_CACHE.popitem(last=False)
+    return result
+
+def start_pdf_render(contract_id: str, contract_text: str) -> asyncio.Future:
+    """Render a contract PDF in the threadpool and remember the pending result"""
+    render = asyncio.get_running_loop().run_in_executor(None, generate_formatted_pdf, contract_text)
+    # Retrieve the outcome even if nobody downloads it, so a failed render
+    # doesn't log "Future exception was never retrieved"
+    render.add_done_callback(lambda f: f.cancelled() or f.exception())
+    PDF_RENDERS[contract_id] = render
+    if len(PDF_RENDERS) > PDF_RENDERS_SIZE:
+        PDF_RENDERS.popitem(last=False)
+    return render
+
+def hash_upload_file(upload: UploadFile) -> str:
+    """Return the SHA-256 hex digest of an uploaded file's contents"""
+    digest = hashlib.sha256()
+    upload.file.seek(0)
+    for block in iter(lambda: upload.file.read(1 << 20), b""):
+        digest.update(block)
+    upload.file.seek(0)
+    return digest.hexdigest()
+
+def get_cached_analysis(file_hash: str):
+    """Get a cached document analysis and mark it as recently used"""
+    analysis = ANALYSIS_CACHE.get(file_hash)
+    if analysis is not None:
+        ANALYSIS_CACHE.move_to_end(file_hash)
+    return analysis
+
+def cache_analysis(file_hash: str, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a document analysis, evicting the least recently used entry when full"""
+    analysis = {
+        "report": analysis_result["report"],
+        "rag_chain": analysis_result["rag_chain"],
+        # RAG chains are not safe for concurrent invoke; every session
+        # sharing this chain serializes on the same lock
+        "lock": asyncio.Lock()
+    }
+    ANALYSIS_CACHE[file_hash] = analysis
+    if len(ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+        ANALYSIS_CACHE.popitem(last=False)
+    return analysis
+
+def report_path(file_hash: str) -> str:
+    """Location of the saved demystifier report for a PDF content hash"""
+    return os.path.join(PDF_UPLOAD_DIR, f"{file_hash}.report.json")
+
+def load_saved_report(file_hash: str):
+    """Load a report saved by an earlier run, or None if there isn't one"""
+    try:
+        with open(report_path(file_hash), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        # A missing or unreadable report is just a miss; the analysis reruns and rewrites it
+        return None
+
+def save_report(file_hash: str, report) -> None:
+    """Save a demystifier report so it survives restarts and cache eviction"""
+    if report is None:
+        return
+    data = report.model_dump() if isinstance(report, BaseModel) else report
+    # Write to a private temp file and swap it in, so a crash or a concurrent
+    # upload of the same PDF never sees a half-written report
+    path = report_path(file_hash)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def delete_saved_report(file_hash: str) -> None:
+    """Remove a saved demystifier report, if there is one"""
+    try:
+        os.remove(report_path(file_hash))
+    except FileNotFoundError:
+        pass
+
+def save_upload_file(upload: UploadFile, destination: str) -> None:
+    """Write an uploaded file to disk, copying in-kernel with sendfile where supported"""
+    src = upload.file
+    src.seek(0)
+    # Spooled uploads need a real file descriptor for sendfile
+    try:
+        src.rollover()
+    except AttributeError:
+        pass
+    with open(destination, "wb") as dst:
+        try:
+            size = os.fstat(src.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # Platforms without file-to-file sendfile fall back to a buffered copy
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+# Chunked video uploads: each chunk is written as <index>.part under its upload's
+# staging directory, and the parts are joined once the last one lands
+MAX_VIDEO_SIZE = 100 * 1024 * 1024
+MAX_VIDEO_CHUNK_SIZE = 8 * 1024 * 1024
+# Chunks must average at least 1MB, which caps the number of files per upload
+MAX_VIDEO_CHUNKS = MAX_VIDEO_SIZE // (1024 * 1024)
+# Staging directories untouched for this long belong to abandoned uploads
+VIDEO_CHUNK_MAX_AGE = 24 * 60 * 60
+VIDEO_ASSEMBLY_LOCK = threading.Lock()
+
+def prune_stale_video_chunks() -> None:
+    """Remove staging directories of chunked uploads that were abandoned"""
+    cutoff = datetime.datetime.now().timestamp() - VIDEO_CHUNK_MAX_AGE
+    try:
+        entries = list(os.scandir(VIDEO_CHUNK_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir() and entry.stat().st_mtime < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+def staged_chunk_bytes(upload_id: str, exclude_index: int) -> int:
+    """Total size of the parts already stored for an upload, not counting `exclude_index`"""
+    directory = os.path.join(VIDEO_CHUNK_DIR, upload_id)
+    return sum(
+        os.path.getsize(os.path.join(directory, f"{index}.part"))
+        for index in received_video_chunks(upload_id)
+        if index != exclude_index
+    )
+
+def received_video_chunks(upload_id: str) -> List[int]:
+    """Indices of the chunks already stored for a chunked upload"""
+    directory = os.path.join(VIDEO_CHUNK_DIR, upload_id)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(int(name[:-len(".part")]) for name in os.listdir(directory) if name.endswith(".part"))
+
+def store_video_chunk(upload: UploadFile, upload_id: str, chunk_index: int, total_chunks: int, destination: str) -> List[int]:
+    """
+    Stage one chunk of a video upload and assemble the video at `destination`
+    once all `total_chunks` parts are present. Returns the received indices.
+    """
+    if os.path.exists(destination):
+        # A chunk retried after the upload completed
+        return list(range(total_chunks))
+
+    src = upload.file
+    src.seek(0, os.SEEK_END)
+    chunk_size = src.tell()
+    src.seek(0)
+
+    directory = os.path.join(VIDEO_CHUNK_DIR, upload_id)
+    with VIDEO_ASSEMBLY_LOCK:
+        if not os.path.isdir(directory):
+            # A new upload is a cheap moment to sweep up abandoned ones
+            prune_stale_video_chunks()
+            os.makedirs(directory, exist_ok=True)
+        if staged_chunk_bytes(upload_id, chunk_index) + chunk_size > MAX_VIDEO_SIZE:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise ValueError("Video too large. Maximum size is 100MB.")
+    part_path = os.path.join(directory, f"{chunk_index}.part")
+    # Write under a temporary name so a half-written chunk is never counted as received
+    save_upload_file(upload, part_path + ".tmp")
+    os.replace(part_path + ".tmp", part_path)
+
+    with VIDEO_ASSEMBLY_LOCK:
+        if os.path.exists(destination):
+            return list(range(total_chunks))
+        received = received_video_chunks(upload_id)
+        if len(received) < total_chunks:
+            return received
+        with open(destination + ".tmp", "wb") as dst:
+            for index in range(total_chunks):
+                with open(os.path.join(directory, f"{index}.part"), "rb") as src:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+        shutil.rmtree(directory, ignore_errors=True)
+        if os.path.getsize(destination + ".tmp") > MAX_VIDEO_SIZE:
+            os.remove(destination + ".tmp")
+            raise ValueError("Video too large. Maximum size is 100MB.")
+        os.replace(destination + ".tmp", destination)
+        return received
+
 # =============================================================================
 # HEALTH CHECK ENDPOINT
 # =============================================================================
 
-@app.get("/health", tags=["System"], response_model=HealthCheck)
+# Optional media modules, probed once via import metadata without executing them
+OPTIONAL_MODULES = {
+    name: "✅" if find_spec(name) else "❌"
+    for name in ("streamlit_webrtc", "av", "speech_recognition")
+}
+
+@app.get("/health", tags=["System"], response_model=None, responses={200: {"model": HealthCheck}})
 async def health_check():
     """Check the health status of the API and its dependencies"""
     
     # Check if required directories exist
     directories = {
-        "video_consents": os.path.exists("video_consents"),
-        "pdfs_demystify": os.path.exists("pdfs_demystify")
+        VIDEO_CONSENT_DIR: os.path.exists(VIDEO_CONSENT_DIR),
+        PDF_UPLOAD_DIR: os.path.exists(PDF_UPLOAD_DIR)
     }
     
     # Check if required modules can be imported
-    modules = {}
-    try:
-        import streamlit_webrtc
-        modules["streamlit_webrtc"] = "✅"
-    except:
-        modules["streamlit_webrtc"] = "❌"
-    
-    try:
-        import av
-        modules["av"] = "✅"
-    except:
-        modules["av"] = "❌"
-    
-    try:
-        import speech_recognition
-        modules["speech_recognition"] = "✅"
-    except:
-        modules["speech_recognition"] = "❌"
+    modules = OPTIONAL_MODULES
     
     # Check API keys
     api_keys = {
@@ -210,22 +507,22 @@ async def health_check():
         "TAVILY_API_KEY": "✅" if os.getenv("TAVILY_API_KEY") else "❌"
     }
     
-    return HealthCheck(
-        status="healthy",
-        version="2.1.0",
-        timestamp=datetime.datetime.now().isoformat(),
-        services={
+    return ORJSONResponse(content={
+        "status": "healthy",
+        "version": "2.1.0",
+        "timestamp": datetime.datetime.now().isoformat(),
+        "services": {
             "directories": directories,
             "modules": modules,
             "api_keys": api_keys
         }
-    )
+    })
 
 # =============================================================================
 # 1. CONTRACT GENERATOR ENDPOINTS
 # =============================================================================
 
-@app.post("/api/v1/contracts/generate", tags=["Contract Generator"], response_model=ApiResponse)
+@app.post("/api/v1/contracts/generate", tags=["Contract Generator"], response_model=ApiResponse, response_model_exclude_none=True)
 async def generate_contract(request: ContractRequest):
     """
     Generate a digital contract from plain text description.
@@ -245,16 +542,22 @@ async def generate_contract(request: ContractRequest):
     try:
         logger.info(f"Generating contract for request: {request.user_request[:100]}...")
         
-        result = legal_agent.invoke({"user_request": request.user_request})
+        result = await run_legal_agent(request.user_request)
         
         # Cache the contract for later use
         contract_id = str(uuid.uuid4())
         CONTRACT_CACHE[contract_id] = {
             **result,
             "created_at": datetime.datetime.now().isoformat(),
-            "user_request": request.user_request
+            "user_request": request.user_request,
+            # Precomputed once so listing contracts doesn't re-slice every document
+            "summary": result.get('legal_doc', '')[:100] + "...",
+            "request_summary": request.user_request[:100] + "..."
         }
         
+        # Render the PDF in the background so a later download doesn't wait on it
+        start_pdf_render(contract_id, result.get('legal_doc', ''))
+        
         return ApiResponse(
             success=True,
             message="Contract generated successfully",
@@ -283,15 +586,17 @@ async def generate_contract_pdf(request: ContractRequest):
     try:
         logger.info(f"Generating PDF contract for request: {request.user_request[:100]}...")
         
-        result = legal_agent.invoke({"user_request": request.user_request})
+        result = await run_legal_agent(request.user_request)
         contract_text = result.get('legal_doc', "Error: Could not generate document text.")
         
-        pdf_bytes = generate_formatted_pdf(contract_text)
+        pdf_bytes = await run_in_threadpool(generate_formatted_pdf, contract_text)
         
         filename = f"contract_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+        # The PDF is already in memory, so send it in one body with a Content-Length
+        # instead of re-chunking it through a BytesIO stream
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment;filename={filename}"}
         )
@@ -299,7 +604,37 @@ async def generate_contract_pdf(request: ContractRequest):
         logger.error(f"PDF generation failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
 
-@app.get("/api/v1/contracts/{contract_id}", tags=["Contract Generator"], response_model=ApiResponse)
+@app.get("/api/v1/contracts/{contract_id}/pdf", tags=["Contract Generator"])
+async def get_contract_pdf(contract_id: str):
+    """
+    Download a previously generated contract as a PDF.
+    
+    The PDF is rendered in the background when the contract is generated,
+    so this neither re-runs the contract agent nor usually waits on rendering.
+    """
+    contract_data = get_contract_data(contract_id)
+    
+    render = PDF_RENDERS.get(contract_id)
+    if render is None or render.cancelled():
+        render = start_pdf_render(contract_id, contract_data.get('legal_doc', ''))
+    else:
+        PDF_RENDERS.move_to_end(contract_id)
+    
+    try:
+        # Shielded: a cancelled download must not cancel the render other downloads share
+        pdf_bytes = await asyncio.shield(render)
+    except Exception as e:
+        PDF_RENDERS.pop(contract_id, None)
+        logger.error(f"PDF rendering failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"PDF rendering failed: {str(e)}")
+    
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment;filename=contract_{contract_id}.pdf"}
+    )
+
+@app.get("/api/v1/contracts/{contract_id}", tags=["Contract Generator"], response_model=ApiResponse, response_model_exclude_none=True)
 async def get_contract(contract_id: str):
     """Retrieve a previously generated contract by ID"""
     contract_data = get_contract_data(contract_id)
@@ -310,38 +645,42 @@ async def get_contract(contract_id: str):
         data=contract_data
     )
 
-@app.get("/api/v1/contracts", tags=["Contract Generator"], response_model=ApiResponse)
+@app.get("/api/v1/contracts", tags=["Contract Generator"], response_model=None, responses={200: {"model": ApiResponse}})
 async def list_contracts():
     """List all generated contracts with summaries"""
-    contracts = []
-    for contract_id, contract_data in CONTRACT_CACHE.items():
-        contracts.append({
+    contracts = [
+        {
             "id": contract_id,
-            "summary": contract_data.get('legal_doc', '')[:100] + "...",
-            "created_at": contract_data.get('created_at', 'Unknown'),
-            "user_request": contract_data.get('user_request', '')[:100] + "..."
-        })
+            "summary": contract_data["summary"],
+            "created_at": contract_data["created_at"],
+            "user_request": contract_data["request_summary"]
+        }
+        for contract_id, contract_data in CONTRACT_CACHE.items()
+    ]
     
-    return ApiResponse(
+    return ORJSONResponse(content=ApiResponse(
         success=True,
         message=f"Found {len(contracts)} contract(s)",
         data={"contracts": contracts}
-    )
+    ).model_dump(exclude_none=True))
 
-@app.delete("/api/v1/contracts/{contract_id}", tags=["Contract Generator"], response_model=ApiResponse)
+@app.delete("/api/v1/contracts/{contract_id}", tags=["Contract Generator"], response_model=ApiResponse, response_model_exclude_none=True)
 async def delete_contract(contract_id: str):
     """Delete a specific contract and its associated data"""
     contract_data = get_contract_data(contract_id)
     
     # Remove contract
     del CONTRACT_CACHE[contract_id]
+    PDF_RENDERS.pop(contract_id, None)
     
     # Remove associated videos
-    video_dir = "video_consents"
-    if os.path.exists(video_dir):
-        for filename in os.listdir(video_dir):
-            if filename.startswith(f"consent_{contract_id}_"):
-                os.remove(os.path.join(video_dir, filename))
+    try:
+        video_files = os.listdir(VIDEO_CONSENT_DIR)
+    except FileNotFoundError:
+        video_files = []
+    for filename in video_files:
+        if filename.startswith(f"consent_{contract_id}_"):
+            os.remove(os.path.join(VIDEO_CONSENT_DIR, filename))
     
     return ApiResponse(
         success=True,
@@ -352,7 +691,7 @@ async def delete_contract(contract_id: str):
 # 2. SCHEME FINDER ENDPOINTS
 # =============================================================================
 
-@app.post("/api/v1/schemes/find", tags=["Scheme Finder"], response_model=ApiResponse)
+@app.post("/api/v1/schemes/find", tags=["Scheme Finder"], response_model=ApiResponse, response_model_exclude_none=True)
 async def find_schemes(request: SchemeRequest):
     """
     Find relevant government schemes based on user profile.
@@ -373,7 +712,16 @@ async def find_schemes(request: SchemeRequest):
     try:
         logger.info(f"Finding schemes for profile: {request.user_profile[:100]}...")
         
-        response = scheme_chatbot.invoke({"user_profile": request.user_profile})
+        cache_key = scheme_cache_key(request.user_profile)
+        profile_vector, response = await run_in_threadpool(SCHEME_CACHE.lookup, request.user_profile, cache_key)
+        if response is None:
+            result = await scheme_chatbot.ainvoke({"user_profile": request.user_profile})
+            response = result["schemes"]
+            # An answer written without search results is served once, never reused
+            if has_search_results(result["search_results"]):
+                SCHEME_CACHE.add(profile_vector, response, cache_key)
+        else:
+            logger.info("Reusing cached schemes for a similar profile")
         
         return ApiResponse(
             success=True,
@@ -388,7 +736,7 @@ async def find_schemes(request: SchemeRequest):
 # 3. PDF DEMYSTIFIER ENDPOINTS
 # =============================================================================
 
-@app.post("/api/v1/demystify/upload", tags=["PDF Demystifier"], response_model=ApiResponse)
+@app.post("/api/v1/demystify/upload", tags=["PDF Demystifier"], response_model=ApiResponse, response_model_exclude_none=True)
 async def demystify_upload(file: UploadFile = File(...)):
     """
     Upload a PDF document for AI-powered analysis.
@@ -417,24 +765,29 @@ async def demystify_upload(file: UploadFile = File(...)):
     try:
         logger.info(f"Processing document: {file.filename}")
         
-        # Save to project directory
-        upload_dir = "pdfs_demystify"
-        os.makedirs(upload_dir, exist_ok=True)
-        
-        file_path = os.path.join(upload_dir, f"{uuid.uuid4()}_{file.filename}")
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Process the document
-        analysis_result = process_document_for_demystification(file_path)
+        # Process the document straight from the upload stream, unless
+        # identical content was analyzed recently
+        file_hash = await run_in_threadpool(hash_upload_file, file)
+        analysis = get_cached_analysis(file_hash)
+        if analysis is None:
+            # A report saved by an earlier run skips the LLM analysis pass;
+            # only the Q&A vector store has to be rebuilt
+            saved_report = await run_in_threadpool(load_saved_report, file_hash)
+            analysis_result = await run_in_threadpool(process_document_for_demystification, file.file, saved_report, name=file.filename)
+            if saved_report is None:
+                await run_in_threadpool(save_report, file_hash, analysis_result["report"])
+            analysis = cache_analysis(file_hash, analysis_result)
+        else:
+            logger.info(f"Reusing cached analysis for {file.filename}")
         
         # Create session and cache RAG chain
         session_id = str(uuid.uuid4())
         SESSION_CACHE[session_id] = {
-            "rag_chain": analysis_result["rag_chain"],
-            "file_path": file_path,
+            "rag_chain": analysis["rag_chain"],
+            "lock": analysis["lock"],
             "upload_time": datetime.datetime.now().isoformat(),
-            "filename": file.filename
+            "filename": file.filename,
+            "file_hash": file_hash
         }
 
         return ApiResponse(
@@ -442,7 +795,7 @@ async def demystify_upload(file: UploadFile = File(...)):
             message="Document uploaded and analyzed successfully",
             data={
                 "session_id": session_id,
-                "report": analysis_result["report"],
+                "report": analysis["report"],
                 "filename": file.filename,
                 "upload_time": datetime.datetime.now().isoformat()
             }
@@ -451,7 +804,7 @@ async def demystify_upload(file: UploadFile = File(...)):
         logger.error(f"Document processing failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Document processing failed: {str(e)}")
 
-@app.post("/api/v1/demystify/chat", tags=["PDF Demystifier"], response_model=ApiResponse)
+@app.post("/api/v1/demystify/chat", tags=["PDF Demystifier"], response_model=ApiResponse, response_model_exclude_none=True)
 async def demystify_chat(request: ChatRequest):
     """
     Ask follow-up questions about an uploaded document.
@@ -472,7 +825,8 @@ async def demystify_chat(request: ChatRequest):
         logger.info(f"Processing question for session {request.session_id}: {request.question[:50]}...")
         
         rag_chain = session_data["rag_chain"]
-        response = rag_chain.invoke(request.question)
+        async with session_data["lock"]:
+            response = await run_in_threadpool(rag_chain.invoke, request.question)
         
         return ApiResponse(
             success=True,
@@ -487,7 +841,40 @@ async def demystify_chat(request: ChatRequest):
         logger.error(f"Chat processing failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Chat processing failed: {str(e)}")
 
-@app.get("/api/v1/demystify/sessions", tags=["PDF Demystifier"], response_model=ApiResponse)
+@app.post("/api/v1/demystify/chat/stream", tags=["PDF Demystifier"])
+async def demystify_chat_stream(request: ChatRequest):
+    """
+    Ask a follow-up question and stream the answer as it is generated.
+    
+    Same input as `/api/v1/demystify/chat`, but the response is a Server-Sent
+    Events stream: `{"token": ...}` events while the answer is generated, then
+    a final `{"done": true}` (or `{"error": ...}` if generation fails).
+    """
+    session_data = get_session_data(request.session_id)
+    logger.info(f"Streaming answer for session {request.session_id}: {request.question[:50]}...")
+    
+    def sse(payload: dict) -> str:
+        return f"data: {json.dumps(payload)}\n\n"
+    
+    async def answer_events():
+        try:
+            async with session_data["lock"]:
+                async for chunk in session_data["rag_chain"].astream(request.question):
+                    yield sse({"token": chunk})
+            yield sse({"done": True})
+        except Exception as e:
+            # Headers are already sent, so the failure has to travel in-band
+            logger.error(f"Error streaming answer: {str(e)}")
+            yield sse({"error": str(e)})
+    
+    return StreamingResponse(
+        answer_events(),
+        media_type="text/event-stream",
+        # Stop reverse proxies from buffering the stream into one response
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/api/v1/demystify/sessions", tags=["PDF Demystifier"], response_model=ApiResponse, response_model_exclude_none=True)
 async def list_demystify_sessions():
     """List all active document analysis sessions"""
     sessions = []
@@ -504,29 +891,31 @@ async def list_demystify_sessions():
         data={"sessions": sessions}
     )
 
-@app.delete("/api/v1/demystify/sessions/{session_id}", tags=["PDF Demystifier"], response_model=ApiResponse)
+@app.delete("/api/v1/demystify/sessions/{session_id}", tags=["PDF Demystifier"], response_model=ApiResponse, response_model_exclude_none=True)
 async def delete_demystify_session(session_id: str):
-    """Delete a document analysis session and its associated files"""
+    """Delete a document analysis session and its saved report"""
     session_data = get_session_data(session_id)
     
     # Remove session
     del SESSION_CACHE[session_id]
     
-    # Remove associated file
-    file_path = session_data.get("file_path")
-    if file_path and os.path.exists(file_path):
-        os.remove(file_path)
+    # Remove the document's saved report and cached analysis; sessions already
+    # holding the analysis keep their own reference to it
+    file_hash = session_data.get("file_hash")
+    if file_hash:
+        ANALYSIS_CACHE.pop(file_hash, None)
+        await run_in_threadpool(delete_saved_report, file_hash)
     
     return ApiResponse(
         success=True,
-        message="Session and associated files deleted successfully"
+        message="Session and saved report deleted successfully"
     )
 
 # =============================================================================
 # 4. GENERAL CHATBOT ENDPOINTS
 # =============================================================================
 
-@app.post("/api/v1/assistant/chat", tags=["General Assistant"], response_model=ApiResponse)
+@app.post("/api/v1/assistant/chat", tags=["General Assistant"], response_model=ApiResponse, response_model_exclude_none=True)
 async def general_chat(request: GeneralChatRequest):
     """
     Get AI-powered assistance for general questions.
@@ -546,7 +935,7 @@ async def general_chat(request: GeneralChatRequest):
     try:
         logger.info(f"Processing general chat question: {request.question[:50]}...")
         
-        response = ask_gemini(request.question)
+        response = await run_in_threadpool(ask_gemini, request.question)
         
         return ApiResponse(
             success=True,
@@ -564,7 +953,9 @@ async def general_chat(request: GeneralChatRequest):
 # MEDIA PROCESSING ENDPOINTS (BONUS)
 # =============================================================================
 
-@app.post("/api/v1/media/upload-video", tags=["Media Processing"], response_model=ApiResponse)
+ALLOWED_VIDEO_TYPES = ["video/mp4", "video/avi", "video/quicktime", "video/x-msvideo"]
+
+@app.post("/api/v1/media/upload-video", tags=["Media Processing"], response_model=ApiResponse, response_model_exclude_none=True)
 async def upload_video_consent(
     file: UploadFile = File(...),
     contract_id: str = Form(...),
@@ -583,29 +974,23 @@ async def upload_video_consent(
     - MP4, AVI, MOV
     - Maximum size: 100MB
     """
-    allowed_types = ["video/mp4", "video/avi", "video/quicktime", "video/x-msvideo"]
-    
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_VIDEO_TYPES:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid video format. Allowed: {', '.join(allowed_types)}"
+            detail=f"Invalid video format. Allowed: {', '.join(ALLOWED_VIDEO_TYPES)}"
         )
     
-    if file.size and file.size > 100 * 1024 * 1024:  # 100MB limit
+    if file.size and file.size > MAX_VIDEO_SIZE:
         raise HTTPException(status_code=400, detail="Video too large. Maximum size is 100MB.")
 
     try:
         logger.info(f"Uploading video consent for contract {contract_id}")
         
         # Save video to project directory
-        upload_dir = "video_consents"
-        os.makedirs(upload_dir, exist_ok=True)
-        
         video_filename = f"consent_{contract_id}_{uuid.uuid4()}.mp4"
-        video_path = os.path.join(upload_dir, video_filename)
+        video_path = os.path.join(VIDEO_CONSENT_DIR, video_filename)
         
-        with open(video_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await run_in_threadpool(save_upload_file, file, video_path)
         
         return ApiResponse(
             success=True,
@@ -622,22 +1007,99 @@ async def upload_video_consent(
         logger.error(f"Video upload failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Video upload failed: {str(e)}")
 
-@app.get("/api/v1/media/videos/{contract_id}", tags=["Media Processing"], response_model=ApiResponse)
+@app.post("/api/v1/media/upload-video-chunk", tags=["Media Processing"], response_model=ApiResponse, response_model_exclude_none=True)
+async def upload_video_chunk(
+    file: UploadFile = File(...),
+    contract_id: str = Form(...),
+    consent_text: str = Form(...),
+    upload_id: str = Header(..., alias="X-Upload-Id"),
+    chunk_index: int = Header(..., alias="X-Chunk-Index"),
+    total_chunks: int = Header(..., alias="X-Total-Chunks")
+):
+    """
+    Upload one chunk of a video consent file.
+    
+    Large recordings are split by the client and sent as numbered chunks that
+    share an `X-Upload-Id`, so a dropped connection only costs the chunk in
+    flight. Chunks may arrive in any order or in parallel; the video is
+    assembled when the last one lands.
+    """
+    try:
+        upload_id = str(uuid.UUID(upload_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="X-Upload-Id must be a UUID")
+    
+    if not 0 < total_chunks <= MAX_VIDEO_CHUNKS:
+        raise HTTPException(status_code=400, detail=f"X-Total-Chunks must be between 1 and {MAX_VIDEO_CHUNKS}")
+    
+    if not 0 <= chunk_index < total_chunks:
+        raise HTTPException(status_code=400, detail="X-Chunk-Index must be between 0 and X-Total-Chunks - 1")
+    
+    if file.content_type not in ALLOWED_VIDEO_TYPES:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid video format. Allowed: {', '.join(ALLOWED_VIDEO_TYPES)}"
+        )
+    
+    if file.size and file.size > MAX_VIDEO_CHUNK_SIZE:
+        raise HTTPException(status_code=400, detail="Chunk too large. Maximum chunk size is 8MB.")
+    
+    video_filename = f"consent_{contract_id}_{upload_id}.mp4"
+    video_path = os.path.join(VIDEO_CONSENT_DIR, video_filename)
+    
+    try:
+        received = await run_in_threadpool(store_video_chunk, file, upload_id, chunk_index, total_chunks, video_path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Video chunk upload failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Video chunk upload failed: {str(e)}")
+    
+    data = {"upload_id": upload_id, "received": received, "complete": os.path.exists(video_path)}
+    if data["complete"]:
+        logger.info(f"Assembled chunked video consent for contract {contract_id}")
+        data.update({
+            "video_path": video_path,
+            "contract_id": contract_id,
+            "filename": video_filename,
+            "size": os.path.getsize(video_path),
+            "consent_text": consent_text
+        })
+    
+    return ApiResponse(
+        success=True,
+        message="Video consent uploaded successfully" if data["complete"] else f"Chunk {chunk_index + 1} of {total_chunks} received",
+        data=data
+    )
+
+@app.get("/api/v1/media/upload-video-chunk/{upload_id}", tags=["Media Processing"], response_model=ApiResponse, response_model_exclude_none=True)
+async def get_video_chunk_status(upload_id: str):
+    """List the chunks already received for a chunked upload, so a client can resume it"""
+    try:
+        upload_id = str(uuid.UUID(upload_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Upload id must be a UUID")
+    
+    received = await run_in_threadpool(received_video_chunks, upload_id)
+    return ApiResponse(
+        success=True,
+        message=f"{len(received)} chunk(s) received",
+        data={"upload_id": upload_id, "received": received}
+    )
+
+@app.get("/api/v1/media/videos/{contract_id}", tags=["Media Processing"], response_model=None, responses={200: {"model": ApiResponse}})
 async def get_contract_videos(contract_id: str):
     """Get all video consents for a specific contract"""
     try:
-        video_dir = "video_consents"
-        if not os.path.exists(video_dir):
-            return ApiResponse(
-                success=True,
-                message="No videos found",
-                data={"videos": []}
-            )
+        try:
+            video_files = os.listdir(VIDEO_CONSENT_DIR)
+        except FileNotFoundError:
+            video_files = []
         
         videos = []
-        for filename in os.listdir(video_dir):
+        for filename in video_files:
             if filename.startswith(f"consent_{contract_id}_"):
-                file_path = os.path.join(video_dir, filename)
+                file_path = os.path.join(VIDEO_CONSENT_DIR, filename)
                 videos.append({
                     "filename": filename,
                     "path": file_path,
@@ -645,11 +1107,11 @@ async def get_contract_videos(contract_id: str):
                     "created": datetime.datetime.now().isoformat()
                 })
         
-        return ApiResponse(
+        return ORJSONResponse(content=ApiResponse(
             success=True,
             message=f"Found {len(videos)} video(s) for contract",
             data={"videos": videos}
-        )
+        ).model_dump(exclude_none=True))
     except Exception as e:
         logger.error(f"Video retrieval failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Video retrieval failed: {str(e)}")
@@ -702,4 +1164,6 @@ async def general_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # loop/http stay on "auto": uvloop and httptools are picked up when installed,
+    # and uvicorn[standard] doesn't install uvloop on Windows
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -1,24 +1,15 @@
 # D:\jan-contract\tools\legal_tools.py
 
-import os
-from dotenv import load_dotenv
 from langchain.tools import tool
-from langchain_community.tools.tavily_search import TavilySearchResults
+from utils.search_cache import tavily_client, acached_search
 
-load_dotenv()
-
-# Safely set environment variable only if it exists
-tavily_key = os.getenv("TAVILY_API_KEY")
-if tavily_key:
-    os.environ["TAVILY_API_KEY"] = tavily_key
+# Increased max_results to 5 for more comprehensive context
+MAX_RESULTS = 5
 
 @tool
-def legal_search(query: str):
+async def legal_search_async(query: str):
     """
     Searches for legal information and relevant sections for a given query in the Indian context.
     Use this tool to find legal trivia and sections related to agreements.
     """
-    # Increased max_results to 5 for more comprehensive context
-    tavily_search = TavilySearchResults(max_results=5)
-    results = tavily_search.invoke(f"Indian law and sections for: {query}")
-    return results
\ No newline at end of file
+    return await acached_search(tavily_client(MAX_RESULTS), f"Indian law and sections for: {query}", MAX_RESULTS)
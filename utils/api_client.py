@@ -0,0 +1,59 @@
+# D:\jan-contract\utils\api_client.py
+
+from types import SimpleNamespace
+import orjson
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds; LLM-backed endpoints can take a while to answer
+DEFAULT_TIMEOUT = (5, 120)
+
+@st.cache_resource
+def get_http() -> requests.Session:
+    """
+    Creates one pooled, keep-alive HTTP session for talking to the backend.
+    Cached across reruns and sessions, so TCP + TLS handshakes happen once per
+    connection instead of on every button click.
+    """
+    session = requests.Session()
+    # Retries only cover idempotent methods (urllib3's default), so a POST that
+    # reached the backend is never sent twice and never pays for a second LLM call
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+def read_json(response: requests.Response):
+    """Decodes a JSON response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
+
+def post_json(url: str, payload: dict) -> dict:
+    """
+    POSTs an orjson-encoded payload and returns the decoded response.
+    Raises requests.HTTPError on a non-2xx status.
+    """
+    response = get_http().post(url, data=orjson.dumps(payload), headers={"Content-Type": "application/json"}, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return read_json(response)
+
+@st.cache_resource(show_spinner=False)
+def endpoints(base_url: str) -> SimpleNamespace:
+    """
+    Builds the backend endpoint URLs once per base URL, so every API path
+    the UI calls is spelled out in this one place.
+    """
+    api = f"{base_url}/api/v1"
+    return SimpleNamespace(
+        health=f"{base_url}/health",
+        generate_contract=f"{api}/contracts/generate",
+        contracts=f"{api}/contracts",
+        find_schemes=f"{api}/schemes/find",
+        demystify_upload=f"{api}/demystify/upload",
+        demystify_chat_stream=f"{api}/demystify/chat/stream",
+        upload_video=f"{api}/media/upload-video",
+        upload_video_chunk=f"{api}/media/upload-video-chunk",
+    )
@@ -1,26 +1,45 @@
 # D:\jan-contract\utils\pdf_generator.py
 
-import re
+import os
+from functools import lru_cache
 from fpdf import FPDF
 
-def markdown_to_html_for_fpdf(md_text: str) -> str:
+# TrueType fonts used for the contract body. The core PDF fonts only cover
+# Latin-1, so without these, characters like the rupee sign are lost.
+# Point them at another font (e.g. Noto Sans) for scripts DejaVu lacks.
+PDF_FONT_PATH = os.getenv("PDF_FONT_PATH", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+PDF_BOLD_FONT_PATH = os.getenv("PDF_BOLD_FONT_PATH", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf")
+
+@lru_cache(maxsize=1)
+def unicode_fonts_available() -> bool:
+    """Checks once whether both TrueType font files are installed."""
+    available = os.path.isfile(PDF_FONT_PATH) and os.path.isfile(PDF_BOLD_FONT_PATH)
+    if not available:
+        print(f"WARNING: PDF fonts not found at {PDF_FONT_PATH}; falling back to Latin-1 only Arial.")
+    return available
+
+def write_simple_markup(pdf: FPDF, text: str, family: str, size: int = 12, line_height: float = 6) -> None:
     """
-    A helper function to convert our simple Markdown (bold and newlines) 
-    into simple HTML that FPDF's write_html method can understand.
+    Writes our simple Markdown (**bold** and newlines) straight onto the page,
+    switching between the regular and bold style at each pair of `**` markers.
     """
-    # 1. Convert **bold** syntax to <b>bold</b> HTML tags
-    # The regex finds text between double asterisks and wraps it in <b> tags.
-    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', md_text)
-    
-    # 2. Convert newline characters to <br> HTML tags for line breaks
-    text = text.replace('\n', '<br>')
-    
-    return text
+    for line in text.split('\n'):
+        parts = line.split('**')
+        if len(parts) % 2 == 0:
+            # An unclosed ** is printed as-is rather than bolding the rest of the line
+            parts[-2:] = ['**'.join(parts[-2:])]
+        for index, part in enumerate(parts):
+            if part:
+                pdf.set_font(family, 'B' if index % 2 else '', size)
+                pdf.write(line_height, part)
+        pdf.ln(line_height)
 
+@lru_cache(maxsize=16)
 def generate_formatted_pdf(text: str) -> bytes:
     """
-    Takes a string containing Markdown and converts it into a well-formatted PDF
-    by first converting the Markdown to HTML and then rendering the HTML.
+    Takes a string containing Markdown (bold and newlines) and renders it
+    into a well-formatted PDF.
+    Results are cached per distinct text, so re-rendering the same document is free.
     
     Args:
         text (str): The content of the contract, with Markdown syntax.
@@ -30,14 +49,18 @@ def generate_formatted_pdf(text: str) -> bytes:
     """
     pdf = FPDF()
     pdf.add_page()
-    pdf.set_font("Arial", size=12)
-    
-    # Convert our Markdown-style text into simple HTML
-    html_content = markdown_to_html_for_fpdf(text)
     
-    # Use the more robust write_html() method to render the formatted text.
-    # We still need to handle character encoding properly.
-    pdf.write_html(html_content.encode('latin-1', 'replace').decode('latin-1'))
+    # Bold spans and line breaks are written directly, without building HTML
+    # for fpdf2's HTML parser
+    if unicode_fonts_available():
+        pdf.add_font("Body", "", PDF_FONT_PATH)
+        pdf.add_font("Body", "B", PDF_BOLD_FONT_PATH)
+        write_simple_markup(pdf, text, "Body")
+    else:
+        # Core fonts can only encode Latin-1, so anything else becomes '?'
+        write_simple_markup(pdf, text.encode('latin-1', 'replace').decode('latin-1'), "Arial")
     
-    # Return the PDF as a 'bytes' object, which Streamlit requires.
+    # fpdf2 deflate-compresses page content by default. output() returns a
+    # bytearray; it is frozen into bytes because the lru_cache hands the same
+    # object to every caller, and a mutable buffer could be altered in place.
     return bytes(pdf.output())
\ No newline at end of file
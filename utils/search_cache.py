@@ -0,0 +1,80 @@
+# D:\jan-contract\utils\search_cache.py
+
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+class SearchCache:
+    """
+    A small in-process cache for web search results. Entries expire after
+    `ttl` seconds, and the least recently used are dropped past `max_entries`.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, results)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query: str, max_results: int) -> str:
+        return hashlib.sha256(f"{max_results}:{query}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Returns the cached results, or None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, results):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# Shared by the legal and scheme search tools
+search_cache = SearchCache(
+    ttl=float(os.getenv("TAVILY_CACHE_TTL_SEC", "300")),
+    max_entries=int(os.getenv("TAVILY_CACHE_MAX_ENTRIES", "256")),
+)
+
+@lru_cache(maxsize=None)
+def tavily_client(max_results: int):
+    """
+    Returns the shared Tavily search client for a result count, built on first
+    use. Building it lazily keeps langchain_community out of module imports, and
+    a missing TAVILY_API_KEY fails only the search rather than the app's startup.
+    """
+    from langchain_community.tools.tavily_search import TavilySearchResults
+    return TavilySearchResults(max_results=max_results)
+
+def cached_search(client, query: str, max_results: int):
+    """Runs `query` through a search client, reusing a recent result for the same query."""
+    key = SearchCache.key(query, max_results)
+    results = search_cache.get(key)
+    if results is None:
+        results = client.invoke(query)
+        # Failed searches come back as an error string; only real result lists are cached
+        if isinstance(results, list):
+            search_cache.set(key, results)
+    return results
+
+async def acached_search(client, query: str, max_results: int):
+    """Async counterpart of cached_search, awaiting the client instead of blocking."""
+    key = SearchCache.key(query, max_results)
+    results = search_cache.get(key)
+    if results is None:
+        results = await client.ainvoke(query)
+        if isinstance(results, list):
+            search_cache.set(key, results)
+    return results
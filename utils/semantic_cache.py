@@ -0,0 +1,78 @@
+# D:\jan-contract\utils\semantic_cache.py
+
+import time
+import threading
+import numpy as np
+from core_utils.core_model_loaders import load_embedding_model
+
+class SemanticCache:
+    """
+    A small in-memory cache that returns a stored response when a new query
+    is semantically close (by cosine similarity) to one answered before.
+    Entries expire after `ttl` seconds, and only match queries stored under
+    the same `key`, so near-identical wording can't cross e.g. a state name.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256, ttl: float = 6 * 60 * 60):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Semantic cache threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._embedder = None
+        self._vectors = None  # (n, dim) matrix of unit-length query embeddings
+        self._responses = []
+        self._keys = []
+        self._expires = []  # time.monotonic() deadline per entry
+        self._lock = threading.Lock()
+
+    def warm(self):
+        """Loads the embedding model ahead of the first lookup."""
+        if self._embedder is None:
+            self._embedder = load_embedding_model()
+
+    def _embed(self, text: str) -> np.ndarray:
+        self.warm()
+        vector = np.asarray(self._embedder.embed_query(text), dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def lookup(self, query: str, key=None):
+        """
+        Embeds the query and returns (embedding, cached_response), matching
+        only live entries stored under the same key.
+        cached_response is None on a miss; embedding is None if embedding failed.
+        """
+        try:
+            vector = self._embed(query)
+        except Exception as e:
+            print(f"Semantic cache embedding failed: {e}")
+            return None, None
+
+        with self._lock:
+            if self._vectors is not None:
+                now = time.monotonic()
+                live = np.array([k == key and t > now for k, t in zip(self._keys, self._expires)])
+                scores = np.where(live, self._vectors @ vector, -np.inf)
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    return vector, self._responses[best]
+        return vector, None
+
+    def add(self, vector, response, key=None):
+        """
+        Stores a response under the embedding returned by lookup() and the same key,
+        dropping expired entries and then the oldest when full.
+        """
+        if vector is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            keep = [i for i, t in enumerate(self._expires) if t > now]
+            keep = keep[max(0, len(keep) - self.max_entries + 1):]
+            if keep:
+                self._vectors = np.vstack([self._vectors[keep], vector])
+            else:
+                self._vectors = vector[np.newaxis, :]
+            self._responses = [self._responses[i] for i in keep] + [response]
+            self._keys = [self._keys[i] for i in keep] + [key]
+            self._expires = [self._expires[i] for i in keep] + [now + self.ttl]